@@ -19,17 +19,46 @@ Author: legalBuddy Team
 License: MIT
 """
 
+import argparse
+import atexit
 import json
 import logging
+import os
+import queue
 import re
 import sys
-from dataclasses import asdict, dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from io import BytesIO
+from itertools import chain
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-from docling.document_converter import DocumentConverter
 from tqdm import tqdm
 
+# Docling (torch, transformers, ...) is imported lazily in get_converter() and
+# warmup_converter() so metadata extraction can be used without loading it.
+if TYPE_CHECKING:
+    from docling.datamodel.document import ConversionResult
+    from docling.document_converter import DocumentConverter
+
+# Faster JSON encoding (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Columnar Parquet summary (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 # ============================================================================
 # Configuration
@@ -38,6 +67,34 @@ from tqdm import tqdm
 RAW_CASES_DIR = Path("data/raw_cases")
 EXTRACTED_CASES_DIR = Path("data/extracted_cases")
 SUMMARY_FILE = "processing_summary.json"
+RESULTS_FILE = "processing_results.jsonl"
+PARQUET_SUMMARY_FILE = "processing_summary.parquet"
+
+# Header metadata (case number, court, parties, dates) sits in the first
+# few KB of a judgment; only this prefix is scanned for it.
+HEADER_CHARS = 8000
+
+# Docling ConversionStatus values whose document is usable; partial successes
+# still carry a document (matches convert() semantics)
+ACCEPTED_STATUSES = ("success", "partial_success")
+
+# Worker threads for parallel conversion (one converter is shared)
+MAX_WORKERS = os.cpu_count() or 1
+
+# Smallest valid PDF (one blank page); converted once to load Docling's models
+WARMUP_PDF_BYTES = (
+    b"%PDF-1.4\n"
+    b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+    b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
+    b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 72 72] >>\nendobj\n"
+    b"xref\n0 4\n"
+    b"0000000000 65535 f \n"
+    b"0000000009 00000 n \n"
+    b"0000000058 00000 n \n"
+    b"0000000115 00000 n \n"
+    b"trailer\n<< /Size 4 /Root 1 0 R >>\n"
+    b"startxref\n184\n%%EOF\n"
+)
 
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -47,7 +104,8 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Data Models
 # ============================================================================
 
-@dataclass
+# slots=True (Python 3.10+) drops the per-instance __dict__ of both models
+@dataclass(slots=True)
 class CaseMetadata:
     """Metadata extracted from legal case documents."""
     case_number: Optional[str] = None
@@ -66,7 +124,7 @@ class CaseMetadata:
             self.parties = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing a single PDF."""
     input_file: str
@@ -79,6 +137,132 @@ class ProcessingResult:
     char_count: int = 0
 
 
+# ============================================================================
+# Output Helpers
+# ============================================================================
+
+def write_all(path: Path, data: bytes) -> None:
+    """
+    Atomically write pre-encoded bytes to a file.
+    
+    Skips the text-codec and buffered-IO layers of Path.write_text. The
+    data goes to a temporary sibling that replaces the target once
+    complete, so a crash never leaves a truncated output that a later
+    run would mistake for a finished one.
+    
+    Args:
+        path: Output file path (created or replaced)
+        data: Encoded file contents
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    except BaseException:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def write_parquet_summary(columns: Dict[str, list], path: Path) -> None:
+    """
+    Write per-file results as a zstd-compressed Parquet table.
+    
+    Args:
+        columns: One list per ProcessingResult field, in file order
+        path: Output .parquet path
+    """
+    table = pa.table({
+        # Few distinct statuses, so dictionary-encode them
+        name: pa.array(values).dictionary_encode() if name == "status" else values
+        for name, values in columns.items()
+    })
+    pq.write_table(table, path, compression="zstd")
+
+
+def shallow_dict(obj) -> Dict:
+    """
+    Convert a dataclass instance to a dict without deep-copying fields.
+    
+    Unlike dataclasses.asdict(), nested lists and dicts are shared rather
+    than recursively copied; the models here only hold JSON-safe values.
+    
+    Args:
+        obj: Dataclass instance
+    
+    Returns:
+        Dict mapping field names to values
+    """
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def dump_json(data) -> bytes:
+    """
+    Serialize data as indented UTF-8 JSON.
+    
+    Uses orjson when installed, otherwise the stdlib encoder with the
+    same layout (2-space indent, non-ASCII kept as-is).
+    
+    Args:
+        data: JSON-serializable object
+    
+    Returns:
+        Encoded JSON bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json_line(data) -> bytes:
+    """
+    Serialize data as one compact UTF-8 JSON Lines record.
+    
+    Args:
+        data: JSON-serializable object
+    
+    Returns:
+        Encoded JSON bytes terminated by a newline
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def load_previous_results(results_path: Path) -> Dict[str, Dict]:
+    """
+    Read the successful per-file records of an earlier run.
+    
+    Lines that do not parse (e.g. cut off by a crash mid-run) are ignored;
+    their PDFs are then simply converted again.
+    
+    Args:
+        results_path: JSON Lines results file of the previous run
+    
+    Returns:
+        Dict mapping input filename to its result record
+    """
+    previous = {}
+    try:
+        with results_path.open("rb") as results_file:
+            for line in results_file:
+                try:
+                    record = orjson.loads(line) if HAS_ORJSON else json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get("status") == "success":
+                    previous[record.get("input_file")] = record
+    except OSError:
+        pass
+    return previous
+
+
 # ============================================================================
 # Logging Setup
 # ============================================================================
@@ -87,6 +271,9 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     """
     Configure logging with console and file handlers.
     
+    The logger only enqueues records; a background QueueListener owns the
+    console and file handlers, so worker threads never block on log I/O.
+    
     Args:
         log_level: Logging level (default: INFO)
     
@@ -113,16 +300,176 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     file_formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
     file_handler.setFormatter(file_formatter)
     
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Handlers run on the listener thread; stopped (and flushed) at exit
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
 
+# ============================================================================
+# Docling Converter
+# ============================================================================
+
+_CONVERTER: Optional["DocumentConverter"] = None
+
+
+def get_converter() -> "DocumentConverter":
+    """
+    Return the shared Docling converter, creating it on first use.
+    
+    Docling caches initialized pipelines per converter, so reusing one
+    instance keeps loaded models across process_all() calls.
+    
+    Returns:
+        Shared DocumentConverter instance
+    """
+    global _CONVERTER
+    if _CONVERTER is None:
+        from docling.document_converter import DocumentConverter
+        _CONVERTER = DocumentConverter()
+    return _CONVERTER
+
+
+def warmup_converter(logger: logging.Logger) -> None:
+    """
+    Initialize Docling's pipeline by converting a blank one-page PDF.
+    
+    Moves model-load latency out of the first real document. Failures are
+    logged and ignored; the pipeline then initializes on first use.
+    
+    Args:
+        logger: Logger instance
+    """
+    logger.info("Warming up Docling converter...")
+    start = time.perf_counter()
+    try:
+        from docling.datamodel.base_models import DocumentStream
+        get_converter().convert(
+            DocumentStream(name="warmup.pdf", stream=BytesIO(WARMUP_PDF_BYTES)),
+            raises_on_error=False
+        )
+    except Exception as e:
+        logger.warning(f"Converter warmup failed: {e}")
+        return
+    logger.info(f"Converter ready in {time.perf_counter() - start:.1f}s")
+
+
 # ============================================================================
 # Metadata Extraction
 # ============================================================================
 
+# Patterns are compiled once at import; extract_metadata runs per PDF.
+# Related patterns share one alternation so each category is a single pass;
+# the named group that matched (``lastgroup``) identifies the variant, and
+# earlier groups take priority (see search_by_priority).
+CASE_NUMBER_RE = re.compile(
+    r"(?P<death_reference>Death Reference No[.\s]+\d+\s+of\s+\d+)"
+    r"|(?P<criminal_appeal>Criminal Appeal No[.\s]+\d+\s+of\s+\d+)"
+    r"|(?P<civil_appeal>Civil Appeal No[.\s]+\d+\s+of\s+\d+)"
+    r"|(?P<criminal_revision>Criminal Revision No[.\s]+\d+\s+of\s+\d+)"
+    r"|(?P<civil_revision>Civil Revision No[.\s]+\d+\s+of\s+\d+)"
+    r"|(?P<writ_petition>Writ Petition No[.\s]+\d+\s+of\s+\d+)"
+    r"|(?P<generic>Case No[.\s]+\d+[/\s]+\d+)",
+    re.IGNORECASE
+)
+
+FILENAME_CASE_RE = re.compile(r"(\d+)_([A-Za-z]+)_")
+
+CASE_TYPES = [
+    "Death Reference",
+    "Criminal Appeal",
+    "Civil Appeal",
+    "Criminal Revision",
+    "Civil Revision",
+    "Writ Petition",
+]
+
+# One case-insensitive pass for any case type; avoids lowercasing the text.
+# Groups follow CASE_TYPES order, so search_by_priority keeps its priority.
+CASE_TYPE_NAMES = {
+    case_type.lower().replace(" ", "_"): case_type for case_type in CASE_TYPES
+}
+CASE_TYPE_RE = re.compile(
+    "|".join(
+        f"(?P<{name}>{re.escape(case_type)})"
+        for name, case_type in CASE_TYPE_NAMES.items()
+    ),
+    re.IGNORECASE
+)
+
+# Only the court names are matched; the value runs to the end of that line.
+# Matching the whole line here would let a lower-priority name hide a
+# higher-priority one later on the same line.
+COURT_RE = re.compile(
+    r"(?P<supreme_court>Supreme Court of Bangladesh)"
+    r"|(?P<high_court_division>High Court Division)"
+    r"|(?P<appellate_division>Appellate Division)"
+)
+
+DISTRICT_RE = re.compile(r"District:\s*([A-Za-z\s]+)\.?")
+
+# "Mr. Justice" matches rank ahead of bare "Justice" ones (see extract_metadata).
+JUDGE_RE = re.compile(
+    r"(?:Hon'ble\s+)?(?P<honorific>Mr\.\s*)?Justice\s+(?P<name>[A-Za-z\s.]+?)(?:\n|And|$)"
+)
+
+# Parties are matched on either side of each "Versus" keyword: the plaintiff
+# in the VERSUS_WINDOW chars before it, starting at a word boundary, and the
+# defendant up to the end of its line. Both patterns are anchored on the
+# keyword, so neither can run into a later "Versus" or stop at a window edge.
+VERSUS_KEYWORD_RE = re.compile(r"Versus", re.IGNORECASE)
+VERSUS_WINDOW = 200
+PLAINTIFF_RE = re.compile(
+    r"(?<![A-Za-z.])([A-Za-z\s.]{1,200}?)\s+-?\s*\Z", re.IGNORECASE
+)
+DEFENDANT_RE = re.compile(
+    r"\s*-?\s*([A-Za-z\s.]+?)(?:\n|$)", re.IGNORECASE
+)
+
+HEARING_RE = re.compile(
+    r"Heard On:\s*(?P<heard_on>[0-9]{2}\.[0-9]{2}\.[0-9]{4}(?:\s+and\s+[0-9]{2}\.[0-9]{2}\.[0-9]{4})?)"
+    r"|Date of Hearing:\s*(?P<date_of_hearing>[0-9]{2}[/-][0-9]{2}[/-][0-9]{4})"
+)
+
+JUDGMENT_RE = re.compile(
+    r"Judgment Delivered On:\s*(?P<delivered_on>[0-9]{2}\.[0-9]{2}\.[0-9]{4})"
+    r"|Date of Judgment:\s*(?P<date_of_judgment>[0-9]{2}[/-][0-9]{2}[/-][0-9]{4})"
+)
+
+
+def search_by_priority(pattern: re.Pattern, text: str) -> Optional[re.Match]:
+    """
+    Search an alternation of named groups, preferring earlier groups.
+    
+    Gives the same match as trying each alternative as its own pattern in
+    order: the first alternative found anywhere wins, at its leftmost
+    occurrence. A plain search() would return whichever occurs first.
+    
+    Args:
+        pattern: Compiled alternation with one named group per alternative
+        text: Text to search
+    
+    Returns:
+        Match of the highest-priority alternative, or None
+    """
+    best = None
+    best_rank = 0
+    for match in pattern.finditer(text):
+        rank = pattern.groupindex[match.lastgroup]
+        if best is None or rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 1:
+                break
+    return best
+
+
 def extract_metadata(text: str, filename: str) -> CaseMetadata:
     """
     Extract structured metadata from legal case text using regex.
@@ -136,107 +483,70 @@ def extract_metadata(text: str, filename: str) -> CaseMetadata:
     """
     metadata = CaseMetadata()
     
-    # Extract case number (multiple patterns)
-    case_patterns = [
-        r"Death Reference No[.\s]+(\d+)\s+of\s+(\d+)",
-        r"Criminal Appeal No[.\s]+(\d+)\s+of\s+(\d+)",
-        r"Civil Appeal No[.\s]+(\d+)\s+of\s+(\d+)",
-        r"Criminal Revision No[.\s]+(\d+)\s+of\s+(\d+)",
-        r"Civil Revision No[.\s]+(\d+)\s+of\s+(\d+)",
-        r"Writ Petition No[.\s]+(\d+)\s+of\s+(\d+)",
-        r"Case No[.\s]+(\d+)[/\s]+(\d+)",
-    ]
-    
-    for pattern in case_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            metadata.case_number = match.group(0).strip()
-            break
+    # Header-style fields are searched in the document head only; the case
+    # type fallback below still scans the full text for body references.
+    head = text[:HEADER_CHARS]
+    
+    # Extract case number
+    case_match = search_by_priority(CASE_NUMBER_RE, head)
+    if case_match:
+        metadata.case_number = case_match.group(0).strip()
     
     # Fallback: extract from filename
     if not metadata.case_number:
-        filename_match = re.search(r"(\d+)_([A-Za-z]+)_", filename)
+        filename_match = FILENAME_CASE_RE.search(filename)
         if filename_match:
             metadata.case_number = filename_match.group(0).rstrip("_")
     
     # Extract case type
-    case_types = [
-        "Death Reference",
-        "Criminal Appeal",
-        "Civil Appeal",
-        "Criminal Revision",
-        "Civil Revision",
-        "Writ Petition",
-    ]
-    for case_type in case_types:
-        if case_type.lower() in text.lower():
-            metadata.case_type = case_type
-            break
+    case_type_match = search_by_priority(CASE_TYPE_RE, text)
+    if case_type_match:
+        metadata.case_type = CASE_TYPE_NAMES[case_type_match.lastgroup]
     
     # Extract court
-    court_patterns = [
-        r"(Supreme Court of Bangladesh[^\n]*)",
-        r"(High Court Division[^\n]*)",
-        r"(Appellate Division[^\n]*)",
-    ]
-    for pattern in court_patterns:
-        match = re.search(pattern, text)
-        if match:
-            metadata.court = match.group(1).strip()
-            break
+    court_match = search_by_priority(COURT_RE, head)
+    if court_match:
+        line_end = head.find("\n", court_match.start())
+        metadata.court = head[court_match.start():line_end if line_end >= 0 else None].strip()
     
     # Extract district
-    district_match = re.search(r"District:\s*([A-Za-z\s]+)\.?", text)
+    district_match = DISTRICT_RE.search(head)
     if district_match:
         metadata.district = district_match.group(1).strip()
     
-    # Extract judges (multiple patterns, limit to first 5)
-    judge_patterns = [
-        r"Mr\.\s*Justice\s+([A-Za-z\s.]+?)(?:\n|And|$)",
-        r"Justice\s+([A-Za-z\s.]+?)(?:\n|And|$)",
-        r"Hon'ble\s+Mr\.\s*Justice\s+([A-Za-z\s.]+?)(?:\n|$)",
-    ]
-    
-    judges_found = []
-    for pattern in judge_patterns:
-        matches = re.findall(pattern, text[:3000])  # Search in first 3000 chars
-        if matches:
-            judges_found.extend([j.strip() for j in matches])
+    # Extract judges (single pass over the first 3000 chars, limit to 5);
+    # "Mr. Justice" names come first, then the rest in document order
+    judge_matches = sorted(
+        JUDGE_RE.finditer(text[:3000]),
+        key=lambda match: match.group("honorific") is None
+    )
+    judges_found = [match.group("name").strip() for match in judge_matches]
     
     # Deduplicate and limit
     metadata.judges = list(dict.fromkeys(judges_found))[:5]
     
     # Extract parties (Plaintiff vs Defendant)
-    versus_match = re.search(
-        r"([A-Za-z\s.]+?)\s+-?\s*Versus\s*-?\s*([A-Za-z\s.]+?)(?:\n|$)",
-        text,
-        re.IGNORECASE
-    )
-    if versus_match:
-        metadata.parties["plaintiff"] = versus_match.group(1).strip()
-        metadata.parties["defendant"] = versus_match.group(2).strip()
+    for keyword in VERSUS_KEYWORD_RE.finditer(head):
+        plaintiff_match = PLAINTIFF_RE.search(
+            head, max(0, keyword.start() - VERSUS_WINDOW), keyword.start()
+        )
+        if not plaintiff_match:
+            continue
+        defendant_match = DEFENDANT_RE.match(head, keyword.end())
+        if defendant_match:
+            metadata.parties["plaintiff"] = plaintiff_match.group(1).strip()
+            metadata.parties["defendant"] = defendant_match.group(1).strip()
+            break
     
     # Extract hearing date
-    hearing_patterns = [
-        r"Heard On:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4}(?:\s+and\s+[0-9]{2}\.[0-9]{2}\.[0-9]{4})?)",
-        r"Date of Hearing:\s*([0-9]{2}[/-][0-9]{2}[/-][0-9]{4})",
-    ]
-    for pattern in hearing_patterns:
-        match = re.search(pattern, text)
-        if match:
-            metadata.hearing_date = match.group(1).strip()
-            break
+    hearing_match = search_by_priority(HEARING_RE, head)
+    if hearing_match:
+        metadata.hearing_date = hearing_match.group(hearing_match.lastgroup).strip()
     
     # Extract judgment date
-    judgment_patterns = [
-        r"Judgment Delivered On:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4})",
-        r"Date of Judgment:\s*([0-9]{2}[/-][0-9]{2}[/-][0-9]{4})",
-    ]
-    for pattern in judgment_patterns:
-        match = re.search(pattern, text)
-        if match:
-            metadata.judgment_date = match.group(1).strip()
-            break
+    judgment_match = search_by_priority(JUDGMENT_RE, head)
+    if judgment_match:
+        metadata.judgment_date = judgment_match.group(judgment_match.lastgroup).strip()
     
     return metadata
 
@@ -245,35 +555,43 @@ def extract_metadata(text: str, filename: str) -> CaseMetadata:
 # PDF Processing
 # ============================================================================
 
-def process_pdf(
-    pdf_path: Path,
-    converter: DocumentConverter,
+# Whitespace-separated token, counted without materializing a word list
+WORD_RE = re.compile(r"\S+")
+
+
+def finalize_result(
+    conv_result: "ConversionResult",
     logger: logging.Logger
 ) -> ProcessingResult:
     """
-    Process a single PDF file using Docling.
+    Export an already-converted Docling document and write its outputs.
     
     Args:
-        pdf_path: Path to the input PDF
-        converter: Docling DocumentConverter instance
+        conv_result: Docling ConversionResult for a single PDF
         logger: Logger instance
     
     Returns:
         ProcessingResult with outputs and status
     """
+    pdf_path = Path(conv_result.input.file)
     result = ProcessingResult(
         input_file=pdf_path.name,
         status="failed"
     )
     
     try:
-        logger.info(f"Processing: {pdf_path.name}")
+        logger.info("Processing: %s", pdf_path.name)
         
-        # Convert PDF using Docling
-        conversion_result = converter.convert(str(pdf_path))
+        # Docling reports conversion failures on the result instead of raising
+        if conv_result.status.value not in ACCEPTED_STATUSES:
+            errors = "; ".join(e.error_message for e in conv_result.errors)
+            raise RuntimeError(
+                f"Conversion {conv_result.status.value}"
+                + (f": {errors}" if errors else "")
+            )
         
         # Extract markdown text
-        markdown_text = conversion_result.document.export_to_markdown()
+        markdown_text = conv_result.document.export_to_markdown()
         
         if not markdown_text or len(markdown_text.strip()) < 50:
             raise ValueError("Insufficient text extracted from PDF")
@@ -288,28 +606,25 @@ def process_pdf(
         metadata_path = EXTRACTED_CASES_DIR / f"{base_name}_metadata.json"
         
         # Save Markdown output
-        markdown_path.write_text(markdown_text, encoding="utf-8")
+        write_all(markdown_path, markdown_text.encode("utf-8"))
+        
+        # Convert metadata once; both JSON outputs reuse the same dict
+        meta_dict = shallow_dict(metadata)
         
         # Save JSON output (Docling's structured export)
         json_data = {
             "filename": pdf_path.name,
             "case_number": metadata.case_number,
             "content": markdown_text,
-            "metadata": asdict(metadata)
+            "metadata": meta_dict
         }
-        json_path.write_text(
-            json.dumps(json_data, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        write_all(json_path, dump_json(json_data))
         
         # Save metadata JSON
-        metadata_path.write_text(
-            json.dumps(asdict(metadata), indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        write_all(metadata_path, dump_json(meta_dict))
         
         # Calculate statistics
-        word_count = len(markdown_text.split())
+        word_count = sum(1 for _ in WORD_RE.finditer(markdown_text))
         char_count = len(markdown_text)
         
         # Update result
@@ -320,26 +635,148 @@ def process_pdf(
         result.word_count = word_count
         result.char_count = char_count
         
-        logger.info(f"  ✓ {base_name}.md — {word_count:,} words, {char_count:,} chars")
-        logger.info(f"    Case: {metadata.case_number or 'Unknown'}")
-        logger.info(f"    Court: {metadata.court or 'Not extracted'}")
-        logger.info(f"    Judges: {len(metadata.judges)} found")
+        logger.info(
+            "  ✓ %s.md — %s words, %s chars",
+            base_name, format(word_count, ","), format(char_count, ",")
+        )
+        logger.info("    Case: %s", metadata.case_number or "Unknown")
+        logger.info("    Court: %s", metadata.court or "Not extracted")
+        logger.info("    Judges: %d found", len(metadata.judges))
         
     except Exception as e:
         result.error_message = str(e)
-        logger.error(f"  ✗ Failed to process {pdf_path.name}: {e}")
+        logger.error("  ✗ Failed to process %s: %s", pdf_path.name, e)
     
     return result
 
 
+def cached_result(
+    pdf_path: Path,
+    previous: Dict[str, Dict],
+    logger: logging.Logger
+) -> Optional[ProcessingResult]:
+    """
+    Return the result of an earlier run if its outputs are still current.
+    
+    A PDF counts as processed when the previous run recorded it as a
+    success and its Markdown, JSON and metadata outputs all exist and are
+    at least as new as the PDF itself. Word and character counts are
+    carried over from that record, so cached outputs are not re-read.
+    
+    Args:
+        pdf_path: Path to the input PDF
+        previous: Successful records of the previous run, by input filename
+        logger: Logger instance
+    
+    Returns:
+        ProcessingResult for the cached outputs, or None if the PDF
+        needs converting
+    """
+    record = previous.get(pdf_path.name)
+    if record is None:
+        return None
+    
+    base_name = pdf_path.stem
+    markdown_path = EXTRACTED_CASES_DIR / f"{base_name}.md"
+    json_path = EXTRACTED_CASES_DIR / f"{base_name}.json"
+    metadata_path = EXTRACTED_CASES_DIR / f"{base_name}_metadata.json"
+    
+    try:
+        source_mtime = pdf_path.stat().st_mtime
+        if any(
+            path.stat().st_mtime < source_mtime
+            for path in (markdown_path, json_path, metadata_path)
+        ):
+            return None
+    except OSError:
+        return None
+    
+    logger.info("  ↷ %s.md — skipped (cached)", base_name)
+    return ProcessingResult(
+        input_file=pdf_path.name,
+        status="success",
+        markdown_output=str(markdown_path),
+        json_output=str(json_path),
+        metadata_output=str(metadata_path),
+        word_count=record.get("word_count", 0),
+        char_count=record.get("char_count", 0)
+    )
+
+
+def process_pdf(
+    pdf_path: Path,
+    converter: "DocumentConverter",
+    logger: logging.Logger
+) -> ProcessingResult:
+    """
+    Convert a single PDF with Docling and write its outputs.
+    
+    Args:
+        pdf_path: Path to the input PDF
+        converter: Docling DocumentConverter instance
+        logger: Logger instance
+    
+    Returns:
+        ProcessingResult with outputs and status
+    """
+    try:
+        conv_result = converter.convert(pdf_path, raises_on_error=False)
+    except Exception as e:
+        logger.error("  ✗ Failed to process %s: %s", pdf_path.name, e)
+        return ProcessingResult(
+            input_file=pdf_path.name,
+            status="failed",
+            error_message=str(e)
+        )
+    
+    return finalize_result(conv_result, logger)
+
+
 # ============================================================================
 # Batch Processing
 # ============================================================================
 
+def iter_results(
+    pdf_files: List[Path],
+    converter: "DocumentConverter",
+    logger: logging.Logger
+) -> Iterator[ProcessingResult]:
+    """
+    Convert PDFs and yield their results as they complete.
+    
+    Uses a thread pool sharing one converter when several workers are
+    available, otherwise streams through Docling's convert_all().
+    
+    Args:
+        pdf_files: PDFs to convert
+        converter: Docling DocumentConverter instance
+        logger: Logger instance
+    
+    Yields:
+        ProcessingResult for each PDF (completion order)
+    """
+    max_workers = min(MAX_WORKERS, len(pdf_files))
+    
+    if max_workers > 1 and len(pdf_files) > 1:
+        logger.info("Converting with %d worker threads", max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(process_pdf, pdf_path, converter, logger)
+                for pdf_path in pdf_files
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        return
+    
+    for conv_result in converter.convert_all(pdf_files, raises_on_error=False):
+        yield finalize_result(conv_result, logger)
+
+
 def process_all(
     raw_dir: Path,
     output_dir: Path,
-    logger: logging.Logger
+    logger: logging.Logger,
+    force: bool = False
 ) -> Dict:
     """
     Process all PDFs in the raw directory.
@@ -348,6 +785,7 @@ def process_all(
         raw_dir: Directory containing input PDFs
         output_dir: Directory for output files
         logger: Logger instance
+        force: Reconvert PDFs even if their outputs are up to date
     
     Returns:
         Processing summary dictionary
@@ -360,47 +798,95 @@ def process_all(
         return {
             "total": 0,
             "successful": 0,
-            "failed": 0,
-            "files": []
+            "failed": 0
         }
     
     logger.info(f"Found {len(pdf_files)} PDF file(s) in {raw_dir}")
     logger.info("=" * 70)
     
-    # Initialize Docling converter
-    logger.info("Initializing Docling converter...")
-    converter = DocumentConverter()
-    
-    # Process each PDF with progress bar
-    results = []
+    # Skip PDFs whose outputs are newer than the source (unless forced)
+    results_path = output_dir / RESULTS_FILE
+    previous = {} if force else load_previous_results(results_path)
+    cached_results = []
+    to_convert = []
+    for pdf_path in pdf_files:
+        cached = cached_result(pdf_path, previous, logger) if previous else None
+        if cached:
+            cached_results.append(cached)
+        else:
+            to_convert.append(pdf_path)
+    
+    if cached_results:
+        logger.info(f"Skipping {len(cached_results)} already-processed file(s)")
+    
+    converted_results = ()
+    if to_convert:
+        # Load Docling models before the first real document; skipped when
+        # nothing needs converting or an earlier call already created it
+        if _CONVERTER is None:
+            warmup_converter(logger)
+        # Reuse the shared Docling converter (pipelines stay initialized)
+        converter = get_converter()
+        converted_results = iter_results(to_convert, converter, logger)
+    
+    # Process PDFs with progress bar; per-file results are streamed to
+    # JSON Lines so only the running totals stay in memory (plus one column
+    # per field for the Parquet summary when pyarrow is installed)
     successful = 0
     failed = 0
+    total_words = 0
+    total_chars = 0
+    columns = (
+        {f.name: [] for f in fields(ProcessingResult)} if HAS_PYARROW else None
+    )
     
-    for pdf_path in tqdm(pdf_files, desc="Processing PDFs", unit="file"):
-        result = process_pdf(pdf_path, converter, logger)
-        results.append(asdict(result))
-        
-        if result.status == "success":
-            successful += 1
-        else:
-            failed += 1
+    with results_path.open("wb") as results_file:
+        for result in tqdm(
+            chain(cached_results, converted_results),
+            total=len(pdf_files),
+            desc="Processing PDFs",
+            unit="file",
+            # Redraw at most ~once a second so worker threads don't
+            # contend on terminal writes
+            mininterval=1.0,
+            miniters=max(1, len(pdf_files) // 100),
+            smoothing=0.1
+        ):
+            result_dict = shallow_dict(result)
+            results_file.write(dump_json_line(result_dict))
+            if columns is not None:
+                for name, value in result_dict.items():
+                    columns[name].append(value)
+            
+            if result.status == "success":
+                successful += 1
+            else:
+                failed += 1
+            total_words += result.word_count
+            total_chars += result.char_count
     
     # Prepare summary
     summary = {
         "total": len(pdf_files),
         "successful": successful,
         "failed": failed,
-        "files": results,
-        "total_words": sum(r["word_count"] for r in results),
-        "total_chars": sum(r["char_count"] for r in results)
+        "results_file": str(results_path),
+        "total_words": total_words,
+        "total_chars": total_chars
     }
     
+    # Save columnar per-file summary
+    if columns is not None:
+        parquet_path = output_dir / PARQUET_SUMMARY_FILE
+        try:
+            write_parquet_summary(columns, parquet_path)
+            summary["parquet_file"] = str(parquet_path)
+        except Exception as e:
+            logger.warning(f"Could not write Parquet summary: {e}")
+    
     # Save summary
     summary_path = output_dir / SUMMARY_FILE
-    summary_path.write_text(
-        json.dumps(summary, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    write_all(summary_path, dump_json(summary))
     
     # Log final summary
     logger.info("=" * 70)
@@ -411,6 +897,9 @@ def process_all(
     logger.info(f"Total words:     {summary['total_words']:,}")
     logger.info(f"Total chars:     {summary['total_chars']:,}")
     logger.info(f"Summary saved:   {summary_path}")
+    logger.info(f"Results saved:   {results_path}")
+    if "parquet_file" in summary:
+        logger.info(f"Parquet saved:   {summary['parquet_file']}")
     logger.info("=" * 70)
     
     return summary
@@ -422,6 +911,16 @@ def process_all(
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(
+        description="Convert legal case PDFs to Markdown and JSON with Docling."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="reprocess PDFs even if their outputs are up to date"
+    )
+    args = parser.parse_args()
+    
     # Setup directories
     RAW_CASES_DIR.mkdir(parents=True, exist_ok=True)
     EXTRACTED_CASES_DIR.mkdir(parents=True, exist_ok=True)
@@ -437,7 +936,9 @@ def main():
     logger.info("=" * 70)
     
     # Process all PDFs
-    summary = process_all(RAW_CASES_DIR, EXTRACTED_CASES_DIR, logger)
+    summary = process_all(
+        RAW_CASES_DIR, EXTRACTED_CASES_DIR, logger, force=args.force
+    )
     
     # Exit with appropriate code
     exit_code = 0 if summary["failed"] == 0 else 1
@@ -4,29 +4,39 @@ Complete PDF Ingestion with Bijoy to Unicode Conversion
 Extracts text from legal case PDFs and converts Bijoy Bengali to Unicode.
 
 Installation:
-    pip install pdfplumber pypdf bijoy2unicode
+    pip install pymupdf pdfplumber pypdf bijoy2unicode orjson
 """
 
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import importlib.util
+import os
 import re
 import json
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, asdict, field
 import logging
 
 # PDF Processing
 import pdfplumber
 from pypdf import PdfReader
 
-# Bijoy conversion
+# PyMuPDF (optional) - C engine, much faster than pdfplumber for plain text
 try:
-    from bijoy2unicode.converter import Unicode
-    bijoy_converter = Unicode()
-    HAS_BIJOY_CONVERTER = True
+    import pymupdf
+    HAS_PYMUPDF = True
 except ImportError:
-    HAS_BIJOY_CONVERTER = False
-    print("⚠️  bijoy2unicode not found. Install with: pip install bijoy2unicode")
-    print("Bengali text will be preserved as Bijoy encoding.")
+    HAS_PYMUPDF = False
+
+# Fast JSON serialization (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Bijoy conversion (imported by LegalCaseExtractor only when conversion is enabled)
+HAS_BIJOY_CONVERTER = importlib.util.find_spec("bijoy2unicode") is not None
 
 # Setup logging
 logging.basicConfig(
@@ -36,6 +46,62 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def dump_json(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON with orjson when installed, else stdlib json (same layout)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode("utf-8")
+
+
+# Extraction
+MIN_TEXT_CHARS = 100  # below this an extractor's output counts as a failure
+METADATA_PAGES = 5    # metadata patterns all sit in the front matter
+HEADER_CHARS = 5000   # district, court, parties and dates sit on the cover page
+
+# Regex patterns, compiled once at import (used for every PDF)
+CASE_NUM_PATTERNS = [
+    re.compile(r'Death Reference No[.\s]+(\d+)\s+of\s+(\d+)', re.IGNORECASE),
+    re.compile(r'Criminal Appeal No[.\s]+(\d+)\s+of\s+(\d+)', re.IGNORECASE),
+    re.compile(r'Case No[.\s]+(\d+)[/\s]+(\d+)', re.IGNORECASE),
+]
+FILENAME_CASE_RE = re.compile(r'(\d+)_([A-Za-z]+)_')
+
+CASE_TYPES = [
+    'Death Reference', 'Criminal Appeal', 'Civil Appeal',
+    'Criminal Revision', 'Civil Revision', 'Writ Petition',
+]
+# One case-insensitive pass over the text instead of lowercasing it per type;
+# CASE_TYPES order is the priority when several types appear
+CASE_TYPES_RE = re.compile('|'.join(map(re.escape, CASE_TYPES)), re.IGNORECASE)
+CASE_TYPES_PRIORITY = {t.lower(): i for i, t in enumerate(CASE_TYPES)}
+
+DISTRICT_RE = re.compile(r'District:\s*([A-Za-z\s]+)\.')
+COURT_RE = re.compile(r'(Supreme Court of Bangladesh[^\n]*)')
+JUDGE_PATTERNS = [
+    re.compile(r'Mr\. Justice ([A-Za-z\s\.]+)'),
+    re.compile(r'Justice ([A-Za-z\s\.]+)'),
+]
+MAX_JUDGES = 5
+JUDGE_SCAN_CHARS = 2000  # judges are listed on the cover page
+# Parties sit either side of a "Versus": the plaintiff is searched from a word
+# start in the VERSUS_WINDOW chars before it (quadratic in the window, so keep
+# it small), the defendant is matched from the keyword on. Neither stops mid-word
+VERSUS_KEYWORD_RE = re.compile(r'Versus', re.IGNORECASE)
+VERSUS_WINDOW = 200
+PLAINTIFF_RE = re.compile(r'(?<![A-Za-z\.])([A-Za-z\s\.]{1,200})\s+-?\s*\Z', re.IGNORECASE)
+DEFENDANT_RE = re.compile(r'\s*-?\s*([A-Za-z\s\.]+)', re.IGNORECASE)
+# The plaintiff's letter run, plus a " -" right before a following "Versus"
+PARTY_RUN_RE = re.compile(r'[A-Za-z\s\.]*(?:(?<=\s)-\s*(?=Versus))?', re.IGNORECASE)
+SEPARATOR_RE = re.compile(r'\s+-?\s*\Z')
+HEARING_RE = re.compile(r'Heard On:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4}(?:\s+and\s+[0-9]{2}\.[0-9]{2}\.[0-9]{4})?)')
+JUDGMENT_RE = re.compile(r'Judgment Delivered On:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4})')
+
+SENTENCE_END = ('.', ':', ';', '?', '!', '।')
+PUNCT_SPACE_RE = re.compile(r'\s+(?=[.,;:!?])')
+
+
 @dataclass
 class CaseMetadata:
     """Metadata extracted from legal case documents"""
@@ -61,6 +127,20 @@ class CaseMetadata:
             self.citations = []
 
 
+@dataclass
+class PageStreamStats:
+    """Running totals for one PDF streamed page by page"""
+    raw_chars: int = 0    # stripped length of the raw page text, markers included
+    head_text: str = ""   # raw text of the first METADATA_PAGES pages
+    bijoy_lines: int = 0
+    words: int = 0
+    chars: int = 0
+    # Encoding detection counts over every raw page (before conversion)
+    unicode_chars: int = 0
+    bijoy_chars: int = 0
+    bijoy_patterns: Set[str] = field(default_factory=set)
+
+
 class BengaliDetector:
     """Detect Bengali text encoding"""
     
@@ -71,40 +151,41 @@ class BengaliDetector:
         'UvKv', 'FY', 'AvBb', 'Av`vjZ', 'Avwg', 'n‡q', 'e‡j'
     ]
     
+    # Character-class regexes: counting with findall runs the per-char test in C
+    UNICODE_BENGALI_RE = re.compile('[\u0980-\u09FF]')
+    BIJOY_CHAR_RE = re.compile('[' + re.escape(''.join(sorted(BIJOY_CHARS))) + ']')
+    
     @staticmethod
-    def detect_unicode_bengali(text: str) -> int:
+    def count_unicode_bengali(text: str) -> int:
         """Count Unicode Bengali characters"""
-        return sum(1 for c in text if '\u0980' <= c <= '\u09FF')
+        return len(BengaliDetector.UNICODE_BENGALI_RE.findall(text))
     
     @staticmethod
-    def detect_bijoy_bengali(text: str) -> int:
-        """Detect Bijoy encoded Bengali"""
-        char_count = sum(1 for c in text if c in BengaliDetector.BIJOY_CHARS)
-        pattern_matches = sum(10 for p in BengaliDetector.BIJOY_PATTERNS if p in text)
-        return char_count + pattern_matches
+    def count_bijoy_chars(text: str) -> int:
+        """Count Bijoy indicator characters"""
+        return len(BengaliDetector.BIJOY_CHAR_RE.findall(text))
     
-    @classmethod
-    def detect_encoding(cls, text: str) -> Tuple[bool, Optional[str], Dict[str, int]]:
+    @staticmethod
+    def find_bijoy_patterns(text: str) -> Set[str]:
+        """Common Bijoy words present in text"""
+        return {p for p in BengaliDetector.BIJOY_PATTERNS if p in text}
+    
+    @staticmethod
+    def classify(unicode_count: int, bijoy_chars: int, bijoy_patterns: Set[str]) -> Tuple[bool, Optional[str]]:
         """
-        Returns: (has_bengali, encoding_type, stats)
+        Classify from counts accumulated over a whole document
+        Returns: (has_bengali, encoding_type)
         """
-        unicode_count = cls.detect_unicode_bengali(text)
-        bijoy_count = cls.detect_bijoy_bengali(text)
-        
-        stats = {
-            'unicode_chars': unicode_count,
-            'bijoy_indicators': bijoy_count,
-            'total_chars': len(text)
-        }
+        bijoy_count = bijoy_chars + 10 * len(bijoy_patterns)
         
         if unicode_count > 100 and bijoy_count > 50:
-            return True, 'mixed', stats
+            return True, 'mixed'
         elif unicode_count > 100:
-            return True, 'unicode', stats
+            return True, 'unicode'
         elif bijoy_count > 30:
-            return True, 'bijoy', stats
+            return True, 'bijoy'
         else:
-            return False, None, stats
+            return False, None
 
 
 class LegalCaseExtractor:
@@ -120,152 +201,217 @@ class LegalCaseExtractor:
         
         self.detector = BengaliDetector()
         self.convert_bijoy = convert_bijoy and HAS_BIJOY_CONVERTER
+        self._bijoy_converter = None
         
-        if convert_bijoy and not HAS_BIJOY_CONVERTER:
+        if self.convert_bijoy:
+            from bijoy2unicode.converter import Unicode
+            self._bijoy_converter = Unicode()
+        elif convert_bijoy:
             logger.warning("Bijoy conversion requested but library not available")
             logger.warning("Install with: pip install bijoy2unicode")
+            logger.warning("Bengali text will be preserved as Bijoy encoding.")
     
     # Bijoy marker characters — present in Bijoy text, absent in plain English
     BIJOY_LINE_MARKERS = set('†‡¨©¯¶ÎïšŒ‰‹Š')
+    _MARKER_CLASS = re.escape(''.join(sorted(BIJOY_LINE_MARKERS)))
+    # A line with two or more markers is treated as Bijoy
+    BIJOY_MARKER_PAIR_RE = re.compile(f'[{_MARKER_CLASS}][^{_MARKER_CLASS}\\n]*[{_MARKER_CLASS}]')
+    
+    # Joins Bijoy lines for one converter call. The converter treats '\r' as
+    # whitespace, so kars are never reordered across it, and unlike '\n' it
+    # does not strip spaces next to it.
+    BIJOY_BATCH_SEP = '\r\x1e'
+    # The converter rebuilds its string on every edit, so very large batches
+    # get slower per line again
+    BIJOY_BATCH_LINES = 200
     
     @staticmethod
-    def _is_bijoy_line(line: str, threshold: int = 2) -> bool:
-        """A line is Bijoy if it has >= threshold Bijoy marker characters."""
-        return sum(1 for c in line if c in LegalCaseExtractor.BIJOY_LINE_MARKERS) >= threshold
+    def _iter_bijoy_lines(text: str):
+        """
+        Yield (start, end) spans of Bijoy lines in text.
+        The regex skips English lines in C, so Python only touches Bijoy lines.
+        """
+        pos = 0
+        while True:
+            match = LegalCaseExtractor.BIJOY_MARKER_PAIR_RE.search(text, pos)
+            if not match:
+                return
+            start = text.rfind('\n', 0, match.start()) + 1
+            end = text.find('\n', match.end())
+            if end < 0:
+                end = len(text)
+            yield start, end
+            pos = end
     
-    def extract_text_pdfplumber(self, pdf_path: Path) -> str:
-        """Extract text using pdfplumber"""
-        try:
-            text_parts = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(f"\n--- Page {page_num} ---\n")
-                        text_parts.append(page_text)
-            return "\n".join(text_parts)
-        except Exception as e:
-            logger.error(f"pdfplumber failed for {pdf_path.name}: {e}")
-            return ""
+    def iter_pages_pymupdf(self, pdf_path: Path) -> Iterator[Tuple[int, str]]:
+        """Yield (page_num, text) using PyMuPDF"""
+        with pymupdf.open(pdf_path) as doc:
+            for page_num, page in enumerate(doc, 1):
+                yield page_num, page.get_text("text")
     
-    def extract_text_pypdf(self, pdf_path: Path) -> str:
-        """Extract text using pypdf (fallback)"""
-        try:
-            text_parts = []
-            reader = PdfReader(pdf_path)
-            for page_num, page in enumerate(reader.pages, 1):
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(f"\n--- Page {page_num} ---\n")
-                    text_parts.append(page_text)
-            return "\n".join(text_parts)
-        except Exception as e:
-            logger.error(f"pypdf failed for {pdf_path.name}: {e}")
-            return ""
+    def iter_pages_pdfplumber(self, pdf_path: Path) -> Iterator[Tuple[int, str]]:
+        """Yield (page_num, text) using pdfplumber (fallback)"""
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_num, page in enumerate(pdf.pages, 1):
+                yield page_num, page.extract_text()
+                page.flush_cache()  # drop parsed layout objects once read
     
-    def extract_text(self, pdf_path: Path) -> str:
-        """Extract text with fallback"""
-        text = self.extract_text_pdfplumber(pdf_path)
-        if not text or len(text.strip()) < 100:
-            logger.warning(f"Trying pypdf fallback for {pdf_path.name}")
-            text = self.extract_text_pypdf(pdf_path)
-        return text
+    def iter_pages_pypdf(self, pdf_path: Path) -> Iterator[Tuple[int, str]]:
+        """Yield (page_num, text) using pypdf (fallback)"""
+        reader = PdfReader(pdf_path)
+        for page_num, page in enumerate(reader.pages, 1):
+            yield page_num, page.extract_text()
     
-    def convert_bengali_to_unicode(self, text: str) -> Tuple[str, bool]:
+    def _page_sources(self) -> List[Tuple[str, Callable[[Path], Iterator[Tuple[int, str]]]]]:
+        """Page extractors in fallback order (PyMuPDF -> pdfplumber -> pypdf)"""
+        sources = [
+            ("pdfplumber", self.iter_pages_pdfplumber),
+            ("pypdf", self.iter_pages_pypdf),
+        ]
+        if HAS_PYMUPDF:
+            sources.insert(0, ("PyMuPDF", self.iter_pages_pymupdf))
+        return sources
+    
+    @staticmethod
+    def _page_block(page_num: int, page_text: str) -> str:
+        return f"\n--- Page {page_num} ---\n\n{page_text}"
+    
+    def _convert_bijoy_batch(self, lines: List[str]) -> List[Optional[str]]:
         """
-        Convert only Bijoy-encoded LINES to Unicode.
-        English lines are left completely untouched.
-        
-        Returns: (converted_text, was_converted)
+        Convert Bijoy lines in one converter call.
+        Falls back to per-line calls if the separator did not survive;
+        None marks a line the converter rejected.
         """
-        if not self.convert_bijoy:
-            return text, False
+        try:
+            converted = self._bijoy_converter.convertBijoyToUnicode(
+                self.BIJOY_BATCH_SEP.join(lines)
+            ).split(self.BIJOY_BATCH_SEP)
+            if len(converted) == len(lines):
+                return converted
+        except Exception:
+            pass
+        
+        converted = []
+        for line in lines:
+            try:
+                converted.append(self._bijoy_converter.convertBijoyToUnicode(line))
+            except Exception:
+                converted.append(None)  # keep original on error
+        return converted
+    
+    def _convert_bijoy_lines(self, text: str) -> Tuple[str, int]:
+        """Returns: (converted_text, number_of_converted_lines)"""
+        spans = list(self._iter_bijoy_lines(text))
+        if not spans:
+            return text, 0
         
+        # Convert Bijoy lines in batches instead of one converter call per line
         converted_lines = []
+        for i in range(0, len(spans), self.BIJOY_BATCH_LINES):
+            batch = [text[start:end] for start, end in spans[i:i + self.BIJOY_BATCH_LINES]]
+            converted_lines.extend(self._convert_bijoy_batch(batch))
+        
+        parts = []
         bijoy_count = 0
+        pos = 0
         
-        for line in text.split('\n'):
-            if self._is_bijoy_line(line):
-                try:
-                    converted_lines.append(bijoy_converter.convertBijoyToUnicode(line))
-                    bijoy_count += 1
-                except Exception:
-                    converted_lines.append(line)  # keep original on error
-            else:
-                converted_lines.append(line)  # English — untouched
+        # English text between Bijoy lines is copied through untouched
+        for (start, end), converted in zip(spans, converted_lines):
+            if converted is None:
+                continue
+            parts.append(text[pos:start])
+            parts.append(converted)
+            pos = end
+            bijoy_count += 1
         
         if bijoy_count > 0:
-            logger.info(f"  Converted {bijoy_count} Bijoy line(s) to Unicode (rest kept as English)")
-            return '\n'.join(converted_lines), True
-        return text, False
+            parts.append(text[pos:])
+            return ''.join(parts), bijoy_count
+        return text, 0
     
     def extract_metadata(self, text: str, filename: str) -> CaseMetadata:
         """Extract structured metadata"""
         metadata = CaseMetadata()
         
-        # Detect Bengali encoding (before conversion)
-        has_bengali, encoding_type, stats = self.detector.detect_encoding(text)
-        metadata.has_bengali = has_bengali
-        metadata.original_encoding = encoding_type
-        
         # Extract case number
-        case_num_patterns = [
-            r'Death Reference No[.\s]+(\d+)\s+of\s+(\d+)',
-            r'Criminal Appeal No[.\s]+(\d+)\s+of\s+(\d+)',
-            r'Case No[.\s]+(\d+)[/\s]+(\d+)',
-        ]
-        
-        for pattern in case_num_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in CASE_NUM_PATTERNS:
+            match = pattern.search(text)
             if match:
                 metadata.case_number = match.group(0)
                 break
         
         if not metadata.case_number:
-            filename_match = re.search(r'(\d+)_([A-Za-z]+)_', filename)
+            filename_match = FILENAME_CASE_RE.search(filename)
             if filename_match:
                 metadata.case_number = filename_match.group(0).rstrip('_')
         
         # Extract case type
-        case_types = [
-            'Death Reference', 'Criminal Appeal', 'Civil Appeal',
-            'Criminal Revision', 'Civil Revision', 'Writ Petition',
-        ]
-        for case_type in case_types:
-            if case_type.lower() in text.lower():
-                metadata.case_type = case_type
-                break
+        best = None
+        for case_type_match in CASE_TYPES_RE.finditer(text):
+            priority = CASE_TYPES_PRIORITY[case_type_match.group(0).lower()]
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
+                    break
+        if best is not None:
+            metadata.case_type = CASE_TYPES[best]
         
         # Extract district
-        district_match = re.search(r'District:\s*([A-Za-z\s]+)\.', text)
+        district_match = DISTRICT_RE.search(text, 0, HEADER_CHARS)
         if district_match:
             metadata.district = district_match.group(1).strip()
         
         # Extract court
-        court_match = re.search(r'(Supreme Court of Bangladesh[^\n]*)', text)
+        court_match = COURT_RE.search(text, 0, HEADER_CHARS)
         if court_match:
             metadata.court = court_match.group(1).strip()
         
-        # Extract judges
-        judge_patterns = [r'Mr\. Justice ([A-Za-z\s\.]+)', r'Justice ([A-Za-z\s\.]+)']
-        for pattern in judge_patterns:
-            judges = re.findall(pattern, text[:2000])
-            if judges:
-                metadata.judges.extend([j.strip() for j in judges])
-        metadata.judges = list(dict.fromkeys(metadata.judges))[:5]
+        # Extract judges (first 5 distinct names, stop scanning once found)
+        judges = {}
+        for pattern in JUDGE_PATTERNS:
+            for judge_match in pattern.finditer(text, 0, JUDGE_SCAN_CHARS):
+                judges.setdefault(judge_match.group(1).strip(), None)
+                if len(judges) == MAX_JUDGES:
+                    break
+            if len(judges) == MAX_JUDGES:
+                break
+        metadata.judges = list(judges)
         
         # Extract parties
-        versus_match = re.search(r'([A-Za-z\s\.]+)\s+-?\s*Versus\s*-?\s*([A-Za-z\s\.]+)', text, re.IGNORECASE)
-        if versus_match:
-            metadata.parties['plaintiff'] = versus_match.group(1).strip()
-            metadata.parties['defendant'] = versus_match.group(2).strip()
+        for keyword in VERSUS_KEYWORD_RE.finditer(text, 0, HEADER_CHARS):
+            plaintiff_match = PLAINTIFF_RE.search(
+                text, max(0, keyword.start() - VERSUS_WINDOW), keyword.start()
+            )
+            defendant_match = plaintiff_match and DEFENDANT_RE.match(text, keyword.end())
+            if not defendant_match:
+                continue
+            plaintiff = plaintiff_match.group(1)
+            
+            # A greedy plaintiff runs on to the last "Versus" its letter run reaches
+            run_end = PARTY_RUN_RE.match(text, plaintiff_match.start(1)).end()
+            later = []
+            for later_keyword in VERSUS_KEYWORD_RE.finditer(text, keyword.end()):
+                if later_keyword.start() > run_end:
+                    break
+                if later_keyword.start() == run_end or text[later_keyword.start() - 1].isspace():
+                    later.append(later_keyword)
+            for later_keyword in reversed(later):
+                later_match = DEFENDANT_RE.match(text, later_keyword.end())
+                if later_match:
+                    plaintiff = SEPARATOR_RE.sub('', text[plaintiff_match.start(1):later_keyword.start()])
+                    defendant_match = later_match
+                    break
+            
+            metadata.parties['plaintiff'] = plaintiff.strip()
+            metadata.parties['defendant'] = defendant_match.group(1).strip()
+            break
         
         # Extract dates
-        hearing_match = re.search(r'Heard On:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4}(?:\s+and\s+[0-9]{2}\.[0-9]{2}\.[0-9]{4})?)', text)
+        hearing_match = HEARING_RE.search(text, 0, HEADER_CHARS)
         if hearing_match:
             metadata.hearing_date = hearing_match.group(1)
         
-        judgment_match = re.search(r'Judgment Delivered On:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4})', text)
+        judgment_match = JUDGMENT_RE.search(text, 0, HEADER_CHARS)
         if judgment_match:
             metadata.judgment_date = judgment_match.group(1)
         
@@ -278,101 +424,178 @@ class LegalCaseExtractor:
         
         lines = []
         for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            line = re.sub(r'\s+', ' ', line)
+            line = ' '.join(line.split())  # strip and collapse whitespace runs
             if len(line) > 1:
                 lines.append(line)
         
+        # Paragraph parts are joined once on flush; growing one string
+        # line by line is quadratic on long paragraphs
         merged_lines = []
-        buffer = ""
+        buf_parts = []
         
         for line in lines:
             if line.startswith("--- Page"):
-                if buffer:
-                    merged_lines.append(buffer)
-                    buffer = ""
+                if buf_parts:
+                    merged_lines.append(" ".join(buf_parts))
+                    buf_parts.clear()
                 merged_lines.append(line)
                 continue
             
-            if buffer:
-                if re.search(r'[.:;?!।]$', buffer):
-                    merged_lines.append(buffer)
-                    buffer = line
+            if buf_parts:
+                last = buf_parts[-1]
+                if last.endswith(SENTENCE_END):
+                    merged_lines.append(" ".join(buf_parts))
+                    buf_parts.clear()
+                    buf_parts.append(line)
+                elif last.endswith('-') and line[0].islower():
+                    buf_parts[-1] = last[:-1] + line
                 else:
-                    if buffer.endswith('-') and line and line[0].islower():
-                        buffer = buffer[:-1] + line
-                    else:
-                        buffer = buffer + " " + line
+                    buf_parts.append(line)
             else:
-                buffer = line
+                buf_parts.append(line)
         
-        if buffer:
-            merged_lines.append(buffer)
+        if buf_parts:
+            merged_lines.append(" ".join(buf_parts))
         
+        # Merged lines never contain newlines, so the join cannot produce
+        # 3+ newline runs; only the space-before-punctuation pass remains
         normalized = "\n\n".join(merged_lines)
-        normalized = re.sub(r'\n{3,}', '\n\n', normalized)
-        normalized = re.sub(r'\s+([.,;:!?])', r'\1', normalized)
+        return PUNCT_SPACE_RE.sub('', normalized)
+    
+    def _stream_pages(self, pages: Iterable[Tuple[int, str]], out: BinaryIO) -> "PageStreamStats":
+        """
+        Convert, normalize and write each page as it is extracted, so only one
+        page of text is held in memory. Pages are independent: normalize_text
+        never merges paragraphs across a page marker.
+        """
+        stats = PageStreamStats()
+        head_blocks = []
+        blocks = 0
+        trailing_ws = 0
         
-        return normalized
+        for page_num, page_text in pages:
+            if not page_text or page_text.isspace():
+                continue
+            block = self._page_block(page_num, page_text)
+            blocks += 1
+            stats.raw_chars += len(block) + 1
+            trailing_ws = len(page_text) - len(page_text.rstrip())
+            if blocks <= METADATA_PAGES:
+                head_blocks.append(block)
+            
+            # Detect Bengali encoding on the raw page (before conversion)
+            stats.unicode_chars += self.detector.count_unicode_bengali(block)
+            stats.bijoy_chars += self.detector.count_bijoy_chars(block)
+            stats.bijoy_patterns |= self.detector.find_bijoy_patterns(block)
+            
+            if self.convert_bijoy:
+                block, bijoy_count = self._convert_bijoy_lines(block)
+                stats.bijoy_lines += bijoy_count
+            
+            clean = self.normalize_text(block)
+            if blocks > 1:
+                clean = "\n\n" + clean
+            out.write(clean.encode("utf-8"))
+            stats.words += len(clean.split())
+            stats.chars += len(clean)
+        
+        # Match len(raw_text.strip()) of the "\n"-joined blocks
+        if blocks:
+            stats.raw_chars -= 2 + trailing_ws
+        stats.head_text = "\n".join(head_blocks)
+        return stats
     
-    def process_pdf(self, pdf_path: Path) -> Tuple[bool, Optional[str]]:
-        """Process a single PDF"""
+    def process_pdf(self, pdf_path: Path) -> Tuple[bool, Optional[str], Optional[Dict]]:
+        """
+        Process a single PDF
+        Returns: (success, text_output_path, metadata_dict)
+        """
+        stem = pdf_path.stem
+        text_output_path = self.output_dir / f"{stem}.txt"
+        partial_path = self.output_dir / f"{stem}.txt.part"
         logger.info(f"Processing: {pdf_path.name}")
         
         try:
-            # Extract text
-            raw_text = self.extract_text(pdf_path)
-            if not raw_text or len(raw_text.strip()) < 100:
-                logger.warning(f"Insufficient text from {pdf_path.name}")
-                return False, None
+            # Extract, convert and normalize page by page; on too little text
+            # start over with the next extractor
+            stats = None
+            for i, (name, iter_pages) in enumerate(self._page_sources()):
+                if i:
+                    logger.warning(f"Trying {name} fallback for {pdf_path.name}")
+                try:
+                    with open(partial_path, "wb") as out:
+                        stats = self._stream_pages(iter_pages(pdf_path), out)
+                except Exception as e:
+                    logger.error(f"{name} failed for {pdf_path.name}: {e}")
+                    stats = None
+                    continue
+                if stats.raw_chars >= MIN_TEXT_CHARS:
+                    break
             
-            # Extract metadata (before conversion)
-            metadata = self.extract_metadata(raw_text, pdf_path.stem)
+            if stats is None or stats.raw_chars < MIN_TEXT_CHARS:
+                logger.warning(f"Insufficient text from {pdf_path.name}")
+                return False, None, None
+            if not stats.chars:
+                logger.warning(f"No text after normalization for {pdf_path.name}")
+                return False, None, None
             
-            # Convert Bijoy to Unicode if needed
-            converted_text, was_converted = self.convert_bengali_to_unicode(raw_text)
+            # Extract metadata from the front pages (before conversion);
+            # the encoding is classified from counts over every page
+            metadata = self.extract_metadata(stats.head_text, stem)
+            metadata.has_bengali, metadata.original_encoding = self.detector.classify(
+                stats.unicode_chars, stats.bijoy_chars, stats.bijoy_patterns
+            )
+            was_converted = stats.bijoy_lines > 0
             metadata.converted_to_unicode = was_converted
-            
-            # Normalize
-            clean_text = self.normalize_text(converted_text)
-            if not clean_text.strip():
-                logger.warning(f"No text after normalization for {pdf_path.name}")
-                return False, None
+            if was_converted:
+                logger.info(f"  Converted {stats.bijoy_lines} Bijoy line(s) to Unicode (rest kept as English)")
             
             # Save text
-            text_output_path = self.output_dir / f"{pdf_path.stem}.txt"
-            text_output_path.write_text(clean_text, encoding="utf-8")
+            partial_path.replace(text_output_path)
             
             # Save metadata
-            metadata_output_path = self.metadata_dir / f"{pdf_path.stem}_metadata.json"
-            metadata_output_path.write_text(
-                json.dumps(asdict(metadata), indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
+            metadata_dict = asdict(metadata)
+            metadata_output_path = self.metadata_dir / f"{stem}_metadata.json"
+            metadata_output_path.write_bytes(dump_json(metadata_dict))
             
             # Log statistics
-            word_count = len(clean_text.split())
-            char_count = len(clean_text)
-            
             bengali_info = ""
             if metadata.has_bengali:
                 conversion_status = " → Unicode" if was_converted else " (preserved)"
                 bengali_info = f" [Bengali: {metadata.original_encoding}{conversion_status}]"
             
             logger.info(f"✓ Saved: {text_output_path.name}")
-            logger.info(f"  Stats: {word_count:,} words, {char_count:,} characters{bengali_info}")
+            logger.info(f"  Stats: {stats.words:,} words, {stats.chars:,} characters{bengali_info}")
             logger.info(f"  Metadata: Case {metadata.case_number or 'Unknown'}")
             
-            return True, str(text_output_path)
+            return True, str(text_output_path), metadata_dict
         
         except Exception as e:
             logger.error(f"Error processing {pdf_path.name}: {e}", exc_info=True)
-            return False, None
+            return False, None, None
+        finally:
+            partial_path.unlink(missing_ok=True)
     
-    def process_all(self) -> Dict:
-        """Process all PDFs"""
+    def _run_pool(self, pdf_files: List[Path], workers: Optional[int]) -> Dict[Path, Tuple[bool, Optional[str], Optional[Dict]]]:
+        """Run process_pdf over all files, in worker processes when workers > 1"""
+        workers = min(workers or os.cpu_count() or 1, len(pdf_files))
+        if workers <= 1:
+            return {pdf_path: self.process_pdf(pdf_path) for pdf_path in pdf_files}
+        
+        outcomes = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            futures = {executor.submit(_process_one, pdf_path): pdf_path for pdf_path in pdf_files}
+            for future in as_completed(futures):
+                pdf_path = futures[future]
+                try:
+                    outcomes[pdf_path] = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed for {pdf_path.name}: {e}")
+                    outcomes[pdf_path] = (False, None, None)
+        return outcomes
+    
+    def process_all(self, workers: Optional[int] = None) -> Dict:
+        """Process all PDFs (workers defaults to the CPU count; 1 runs serially)"""
         pdf_files = list(self.raw_dir.glob("*.pdf"))
         
         if not pdf_files:
@@ -395,23 +618,22 @@ class LegalCaseExtractor:
             }
         }
         
+        outcomes = self._run_pool(pdf_files, workers)
+        
         for pdf_path in pdf_files:
-            success, output_path = self.process_pdf(pdf_path)
+            success, output_path, metadata = outcomes[pdf_path]
             
             if success:
                 results["successful"] += 1
                 
                 # Get Bengali stats
-                metadata_file = self.metadata_dir / f"{pdf_path.stem}_metadata.json"
-                if metadata_file.exists():
-                    metadata = json.loads(metadata_file.read_text(encoding='utf-8'))
-                    encoding = metadata.get('original_encoding')
-                    if encoding:
-                        results["bengali_stats"][encoding] += 1
-                        if metadata.get('converted_to_unicode'):
-                            results["bengali_stats"]["converted"] += 1
-                    else:
-                        results["bengali_stats"]["none"] += 1
+                encoding = metadata['original_encoding']
+                if encoding:
+                    results["bengali_stats"][encoding] += 1
+                    if metadata['converted_to_unicode']:
+                        results["bengali_stats"]["converted"] += 1
+                else:
+                    results["bengali_stats"]["none"] += 1
                 
                 results["files"].append({
                     "input": str(pdf_path),
@@ -428,10 +650,7 @@ class LegalCaseExtractor:
         
         # Save summary
         summary_path = self.output_dir / "processing_summary.json"
-        summary_path.write_text(
-            json.dumps(results, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        summary_path.write_bytes(dump_json(results, indent=True))
         
         logger.info("\n" + "="*60)
         logger.info(f"Processing Complete!")
@@ -447,6 +666,19 @@ class LegalCaseExtractor:
         return results
 
 
+# Worker-process state: each worker unpickles the extractor once, not per PDF
+_worker_extractor: Optional[LegalCaseExtractor] = None
+
+
+def _init_worker(extractor: LegalCaseExtractor) -> None:
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _process_one(pdf_path: Path) -> Tuple[bool, Optional[str], Optional[Dict]]:
+    return _worker_extractor.process_pdf(pdf_path)
+
+
 def main():
     """Main execution"""
     RAW_DIR = Path("data/raw_cases")